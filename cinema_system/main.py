@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""!
+@file main.py
+@author Filonenko Daryna (rina4203)
+@version 1.0
+@date 2025-11-12
+@brief Console user interface for the cinema system.
+
+@details
+    This module implements the interactive text menu on top of
+    `CinemaManager`. The menu text is built once as a module constant and
+    printed with a single call per iteration, and option handling is done
+    through a dispatch dictionary instead of a chain of `elif` branches.
+
+@see movie_manager.py
+"""
+
+import sys
+
+from movie_manager import CinemaManager
+
+## The full menu text, printed once per loop iteration.
+MENU = """
+--- ГОЛОВНЕ МЕНЮ ---
+1. Показати всі фільми
+2. Знайти фільм за назвою
+3. Показати сеанси фільму
+4. Додати сеанс
+5. Забронювати квитки
+6. Показати бронювання
+7. Скасувати бронювання
+0. Вийти
+"""
+
+
+def print_movies(movies):
+    """!
+    @brief Prints a formatted list of movies.
+
+    @details
+        The whole listing is joined into one string and written with a
+        single `sys.stdout.write` call, instead of one `print` (and one
+        stdout lock/flush) per movie.
+
+    @param movies The list of `Movie` objects to display.
+    @return None
+    """
+    if not movies:
+        print("Фільмів не знайдено.")
+        return
+    lines = [f"  - '{m.title}' ({m.year}), реж. {m.director}, "
+             f"рейтинг: {m.rating}, жанри: {m._genres_str}"
+             for m in movies]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _handle_list_movies(cinema: CinemaManager) -> None:
+    """!
+    @brief Handler for menu option 1: show the full catalog.
+    @param cinema The `CinemaManager` instance.
+    """
+    print_movies(cinema.get_all_movies())
+
+
+def _handle_find_movie(cinema: CinemaManager) -> None:
+    """!
+    @brief Handler for menu option 2: search movies by title.
+    @param cinema The `CinemaManager` instance.
+    """
+    query = input("Введіть назву (або її частину): ")
+    print_movies(cinema.find_movie_by_title(query))
+
+
+def _handle_list_screenings(cinema: CinemaManager) -> None:
+    """!
+    @brief Handler for menu option 3: show screenings for a movie.
+    @param cinema The `CinemaManager` instance.
+    """
+    title = input("Введіть назву фільму: ")
+    screenings = cinema.get_screenings_for_movie(title)
+    if not screenings:
+        print("Сеансів не знайдено.")
+        return
+    lines = [f"  - [{s.screening_id}] '{s.movie_title}' о {s.screening_time}, "
+             f"вільних місць: {s.available_seats}"
+             for s in screenings]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _handle_add_screening(cinema: CinemaManager) -> None:
+    """!
+    @brief Handler for menu option 4: add a new screening.
+    @param cinema The `CinemaManager` instance.
+    """
+    title = input("Назва фільму: ")
+    time = input("Час сеансу (РРРР-ММ-ДД ГГ:ХХ): ")
+    try:
+        seats = int(input("Кількість місць: "))
+    except ValueError:
+        print("Помилка: кількість місць має бути числом.")
+        return
+    screening = cinema.add_screening(title, time, seats)
+    if screening:
+        print(f"Сеанс додано, ID: {screening.screening_id}")
+    else:
+        print("Помилка: фільм не знайдено.")
+
+
+def _handle_book_tickets(cinema: CinemaManager) -> None:
+    """!
+    @brief Handler for menu option 5: book tickets for a screening.
+    @param cinema The `CinemaManager` instance.
+    """
+    screening_id = input("ID сеансу: ")
+    try:
+        num = int(input("Кількість квитків: "))
+    except ValueError:
+        print("Помилка: кількість квитків має бути числом.")
+        return
+    booking = cinema.book_tickets(screening_id, num)
+    if booking:
+        print(f"Бронювання успішне, ID: {booking.booking_id}")
+    else:
+        print("Помилка: бронювання не вдалося.")
+
+
+def _handle_list_bookings(cinema: CinemaManager) -> None:
+    """!
+    @brief Handler for menu option 6: show all bookings.
+    @param cinema The `CinemaManager` instance.
+    """
+    if not cinema.bookings:
+        print("Бронювань немає.")
+        return
+    lines = [f"  - [{b.booking_id}] '{b.movie_title}', "
+             f"квитків: {b.num_tickets} (сеанс {b.screening_id})"
+             for b in cinema.bookings.values()]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _handle_cancel_booking(cinema: CinemaManager) -> None:
+    """!
+    @brief Handler for menu option 7: cancel a booking.
+    @param cinema The `CinemaManager` instance.
+    """
+    booking_id = input("ID бронювання: ")
+    if cinema.cancel_booking(booking_id):
+        print("Бронювання скасовано.")
+    else:
+        print("Помилка: бронювання не знайдено.")
+
+
+## Dispatch table: menu choice -> handler (O(1) lookup instead of elif chain).
+HANDLERS = {
+    '1': _handle_list_movies,
+    '2': _handle_find_movie,
+    '3': _handle_list_screenings,
+    '4': _handle_add_screening,
+    '5': _handle_book_tickets,
+    '6': _handle_list_bookings,
+    '7': _handle_cancel_booking,
+}
+
+
+def main() -> None:
+    """!
+    @brief Entry point of the console application.
+
+    @details
+        Runs the interactive menu loop until the user chooses to exit.
+        Each iteration prints the prebuilt `MENU` constant once and
+        dispatches the choice through the `HANDLERS` dictionary.
+    """
+    cinema = CinemaManager()
+    while True:
+        print(MENU)
+        choice = input("Ваш вибір: ")
+        if choice == '0':
+            print("До побачення!")
+            break
+        handler = HANDLERS.get(choice)
+        if handler is None:
+            print("Невірний вибір, спробуйте ще раз.")
+        else:
+            handler(cinema)
+
+
+if __name__ == '__main__':
+    main()
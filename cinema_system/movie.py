@@ -14,18 +14,22 @@
 @see main.py, unit_test.py
 """
 
+import bisect
 import json
 import uuid
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Movie:
     """!
     @brief A data container class (dataclass) for representing a movie.
-    @details Stores all key information about a movie.
+    @details Stores all key information about a movie. Slotted, so
+        instances carry no per-instance `__dict__`, and frozen: a movie
+        is an immutable record once created.
     """
     title: str              ##< The title of the movie.
     year: int               ##< The release year of the movie.
@@ -34,6 +38,7 @@ class Movie:
     actors: List[str] = field(default_factory=list)     ##< A list of main actors.
     runtime_minutes: int = 0  ##< The runtime of the movie in minutes.
     rating: float = 0.0     ##< The movie's rating (e.g., out of 10.0).
+    _title_lower: str = field(init=False, repr=False, compare=False)  ##< Cached lowercase title.
 
     def __post_init__(self):
         """!
@@ -48,8 +53,34 @@ class Movie:
             raise ValueError("Movie release year cannot be earlier than 1888.")
         if self.runtime_minutes < 0:
             raise ValueError("Movie runtime cannot be negative.")
+        # Cache the lowercase title once so searches stop re-lowering it.
+        object.__setattr__(self, '_title_lower', self.title.lower())
 
-@dataclass
+    @classmethod
+    def from_trusted(cls, title, year, director, genres=None, actors=None,
+                     runtime_minutes=0, rating=0.0) -> 'Movie':
+        """!
+        @brief Builds a `Movie` from already-validated data, skipping checks.
+        @details
+            Bypasses `__init__`/`__post_init__` with `object.__new__` plus
+            direct slot assignment. Intended for trusted sources only —
+            module literals and persisted data that passed validation when
+            it was first created. User-submitted data must go through the
+            normal constructor.
+        @return Movie The constructed instance.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, 'title', title)
+        object.__setattr__(obj, 'year', year)
+        object.__setattr__(obj, 'director', director)
+        object.__setattr__(obj, 'genres', genres if genres is not None else [])
+        object.__setattr__(obj, 'actors', actors if actors is not None else [])
+        object.__setattr__(obj, 'runtime_minutes', runtime_minutes)
+        object.__setattr__(obj, 'rating', rating)
+        object.__setattr__(obj, '_title_lower', title.lower())
+        return obj
+
+@dataclass(slots=True)
 class Screening:
     """!
     @brief A data container class (dataclass) for representing a movie screening.
@@ -58,8 +89,23 @@ class Screening:
     movie_title: str        ##< The title of the movie being shown.
     screening_time: str     ##< The time of the screening in 'YYYY-MM-DD HH:MM' format.
     total_seats: int        ##< The total number of seats in the theater.
-    screening_id: str = field(default_factory=lambda: str(uuid.uuid4())) ##< Unique ID for the screening (UUIDv4).
+    screening_id: str = field(default_factory=lambda: uuid.uuid4().hex) ##< Unique ID for the screening (UUIDv4 hex).
     booked_seats: int = 0   ##< The number of seats already booked.
+    _movie_title_lower: str = field(init=False, repr=False, compare=False)  ##< Cached lowercase movie title.
+    _ts: int = field(init=False, repr=False, compare=False)  ##< Screening time as epoch seconds.
+
+    def __post_init__(self):
+        """!
+        @brief Validates the time format and caches derived values.
+        @details
+            Parses `screening_time` exactly once, storing it as epoch
+            seconds in `_ts` so sorting and comparisons are C-level int
+            compares rather than string compares.
+        @throws ValueError If `screening_time` is not 'YYYY-MM-DD HH:MM'.
+        """
+        parsed = datetime.strptime(self.screening_time, '%Y-%m-%d %H:%M')
+        object.__setattr__(self, '_ts', int(parsed.timestamp()))
+        object.__setattr__(self, '_movie_title_lower', self.movie_title.lower())
 
     @property
     def available_seats(self) -> int:
@@ -69,7 +115,7 @@ class Screening:
         """
         return self.total_seats - self.booked_seats
 
-@dataclass
+@dataclass(slots=True)
 class Booking:
     """!
     @brief A data container class (dataclass) for representing a booking.
@@ -78,26 +124,34 @@ class Booking:
     screening_id: str       ##< The ID of the screening being booked.
     movie_title: str        ##< The title of the movie (for convenience).
     num_tickets: int        ##< The number of tickets booked.
-    booking_id: str = field(default_factory=lambda: str(uuid.uuid4())) ##< Unique ID for the booking (UUIDv4).
+    booking_id: str = field(default_factory=lambda: uuid.uuid4().hex) ##< Unique ID for the booking (UUIDv4 hex).
+
+
+## Default catalog, built once at import through the trusted constructor.
+## Movie records are frozen, so sharing them between managers is safe.
+_DEFAULT_MOVIES: tuple = (
+        Movie.from_trusted("The Shawshank Redemption", 1994, "Frank Darabont", ["Drama"], ["Tim Robbins", "Morgan Freeman"], 142, 9.3),
+        Movie.from_trusted("The Godfather", 1972, "Francis Ford Coppola", ["Crime", "Drama"], ["Marlon Brando", "Al Pacino"], 175, 9.2),
+        Movie.from_trusted("The Dark Knight", 2008, "Christopher Nolan", ["Action", "Crime", "Drama"], ["Christian Bale", "Heath Ledger"], 152, 9.0),
+        Movie.from_trusted("Pulp Fiction", 1994, "Quentin Tarantino", ["Crime", "Drama"], ["John Travolta", "Uma Thurman", "Samuel L. Jackson"], 154, 8.9),
+        Movie.from_trusted("Forrest Gump", 1994, "Robert Zemeckis", ["Drama", "Romance"], ["Tom Hanks", "Robin Wright"], 142, 8.8),
+        Movie.from_trusted("Inception", 2010, "Christopher Nolan", ["Action", "Adventure", "Sci-Fi"], ["Leonardo DiCaprio", "Joseph Gordon-Levitt"], 148, 8.8),
+        Movie.from_trusted("The Matrix", 1999, "Lana Wachowski", ["Action", "Sci-Fi"], ["Keanu Reeves", "Laurence Fishburne"], 136, 8.7),
+        Movie.from_trusted("Fight Club", 1999, "David Fincher", ["Drama"], ["Brad Pitt", "Edward Norton"], 139, 8.8),
+        Movie.from_trusted("Goodfellas", 1990, "Martin Scorsese", ["Biography", "Crime", "Drama"], ["Robert De Niro", "Ray Liotta", "Joe Pesci"], 146, 8.7),
+        Movie.from_trusted("Parasite", 2019, "Bong Joon Ho", ["Comedy", "Drama", "Thriller"], ["Song Kang-ho", "Lee Sun-kyun"], 132, 8.6)
+)
 
 
 def create_default_movies() -> List[Movie]:
     """!
     @brief Creates an initial list of movies.
+    @details Returns a fresh list over the `_DEFAULT_MOVIES` tuple built
+        once at import, so repeated `CinemaManager()` constructions do not
+        rebuild ten `Movie` objects each time.
     @return A list of Movie objects with test data.
     """
-    return [
-        Movie("The Shawshank Redemption", 1994, "Frank Darabont", ["Drama"], ["Tim Robbins", "Morgan Freeman"], 142, 9.3),
-        Movie("The Godfather", 1972, "Francis Ford Coppola", ["Crime", "Drama"], ["Marlon Brando", "Al Pacino"], 175, 9.2),
-        Movie("The Dark Knight", 2008, "Christopher Nolan", ["Action", "Crime", "Drama"], ["Christian Bale", "Heath Ledger"], 152, 9.0),
-        Movie("Pulp Fiction", 1994, "Quentin Tarantino", ["Crime", "Drama"], ["John Travolta", "Uma Thurman", "Samuel L. Jackson"], 154, 8.9),
-        Movie("Forrest Gump", 1994, "Robert Zemeckis", ["Drama", "Romance"], ["Tom Hanks", "Robin Wright"], 142, 8.8),
-        Movie("Inception", 2010, "Christopher Nolan", ["Action", "Adventure", "Sci-Fi"], ["Leonardo DiCaprio", "Joseph Gordon-Levitt"], 148, 8.8),
-        Movie("The Matrix", 1999, "Lana Wachowski", ["Action", "Sci-Fi"], ["Keanu Reeves", "Laurence Fishburne"], 136, 8.7),
-        Movie("Fight Club", 1999, "David Fincher", ["Drama"], ["Brad Pitt", "Edward Norton"], 139, 8.8),
-        Movie("Goodfellas", 1990, "Martin Scorsese", ["Biography", "Crime", "Drama"], ["Robert De Niro", "Ray Liotta", "Joe Pesci"], 146, 8.7),
-        Movie("Parasite", 2019, "Bong Joon Ho", ["Comedy", "Drama", "Thriller"], ["Song Kang-ho", "Lee Sun-kyun"], 132, 8.6)
-    ]
+    return list(_DEFAULT_MOVIES)
 
 
 class CinemaManager:
@@ -133,8 +187,38 @@ class CinemaManager:
         @see create_default_movies()
         """
         self._movies: List[Movie] = movies if movies is not None else create_default_movies()
-        self.screenings: List[Screening] = []
-        self.bookings: List[Booking] = []
+        # Duplicate-detection keys; add_movie tests membership here instead
+        # of re-lowercasing every stored title per insert.
+        self._movie_keys = {(m._title_lower, m.year) for m in self._movies}
+        # Structure-of-arrays mirror of the catalog titles: searching scans
+        # this flat list of strings instead of dereferencing one Movie
+        # object per row. Kept in sync by add_movie.
+        self._titles_lower: List[str] = [m._title_lower for m in self._movies]
+        # Movies grouped by lowercase title: add_screening resolves its
+        # exact-match-plus-ambiguity rule with one dict probe.
+        self._movies_by_title_lower: Dict[str, List[Movie]] = {}
+        for m in self._movies:
+            self._movies_by_title_lower.setdefault(m._title_lower, []).append(m)
+        # Search memoization: the cache key includes _catalog_version, so
+        # bumping the version on mutation invalidates stale entries by key
+        # mismatch and old results simply age out of the LRU.
+        self._catalog_version = 0
+        self._find_cached = lru_cache(maxsize=256)(self._find_movies_scan)
+        # Trigram inverted index: every 3-char window of a lowered title
+        # maps to the set of catalog indexes containing it. Searches
+        # intersect the query's trigram sets to get a candidate shortlist.
+        self._trigrams: Dict[str, set] = {}
+        for i, title in enumerate(self._titles_lower):
+            self._index_trigrams(title, i)
+        # Screenings bucketed by lowercase movie title; each bucket is kept
+        # chronologically sorted on insert, so schedule queries never re-sort.
+        self._screenings_by_movie: Dict[str, List[Screening]] = {}
+        # Bookings keyed by booking_id: creation and cancellation are both
+        # O(1) dict operations, with no field-wise list.remove scan.
+        self.bookings: Dict[str, Booking] = {}
+        # By-ID index over the screening buckets, maintained by
+        # add_screening, so by-ID lookups are hash probes.
+        self._screenings_by_id: Dict[str, Screening] = {}
 
     def get_all_movies(self) -> List[Movie]:
         """!
@@ -150,18 +234,63 @@ class CinemaManager:
         @param movie The `Movie` object to add.
         @return None
         """
-        for m in self._movies:
-            if m.title.lower() == movie.title.lower() and m.year == movie.year:
-                return
+        key = (movie._title_lower, movie.year)
+        if key in self._movie_keys:
+            return
+        self._movie_keys.add(key)
         self._movies.append(movie)
+        self._titles_lower.append(movie._title_lower)
+        self._movies_by_title_lower.setdefault(movie._title_lower, []).append(movie)
+        self._index_trigrams(movie._title_lower, len(self._movies) - 1)
+        self._catalog_version += 1
+
+    def _index_trigrams(self, title_lower: str, index: int) -> None:
+        """!
+        @brief Registers one title's 3-char windows in the trigram index.
+        @param title_lower The already-lowercased title.
+        @param index The position of the movie in `_movies`.
+        """
+        trigrams = self._trigrams
+        for j in range(len(title_lower) - 2):
+            trigrams.setdefault(title_lower[j:j + 3], set()).add(index)
+
+    def _find_movies_scan(self, query_lower: str, version: int) -> tuple:
+        """!
+        @brief Uncached search backing `find_movie_by_title`.
+        @details
+            Queries of three or more characters intersect the trigram
+            posting sets to get a candidate shortlist, then verify each
+            candidate with a real substring check (trigram overlap alone
+            can produce false positives). Shorter queries fall back to the
+            flat scan, since they carry no complete trigram.
+        @param query_lower The already-lowercased search string.
+        @param version The catalog version the result is valid for.
+        @return tuple The matching `Movie` objects (hashable, cacheable).
+        """
+        movies = self._movies
+        titles = self._titles_lower
+        if len(query_lower) < 3:
+            return tuple(movies[i] for i, t in enumerate(titles)
+                         if query_lower in t)
+        trigrams = self._trigrams
+        posting_sets = []
+        for j in range(len(query_lower) - 2):
+            posting = trigrams.get(query_lower[j:j + 3])
+            if posting is None:
+                return ()  # Some trigram occurs in no title: no match possible.
+            posting_sets.append(posting)
+        candidates = sorted(set.intersection(*posting_sets))
+        return tuple(movies[i] for i in candidates if query_lower in titles[i])
 
     def find_movie_by_title(self, title_query: str) -> List[Movie]:
         """!
         @brief Finds movies by a partial title (substring search).
+        @details Repeated identical queries are served from an LRU cache
+            and skip the catalog scan entirely.
         @param title_query The string to search for (case-insensitive).
         @return List[Movie] A list of found movies.
         """
-        return [m for m in self._movies if title_query.lower() in m.title.lower()]
+        return list(self._find_cached(title_query.lower(), self._catalog_version))
 
     def add_screening(self, movie_title: str, screening_time: str, total_seats: int) -> Optional[Screening]:
         """!
@@ -178,22 +307,21 @@ class CinemaManager:
         
         @return Optional[Screening] The created `Screening` object, or `None` if validation fails.
         """
+        # 1. Resolve the exact title with one dict probe; the bucket length
+        #    encodes both the no-match and the ambiguity case.
+        candidates = self._movies_by_title_lower.get(movie_title.lower(), ())
+        if len(candidates) != 1:
+            return None # Movie not found or title is ambiguous
+        
+        movie = candidates[0]
         try:
-            # 1. Validate time format
-            datetime.strptime(screening_time, '%Y-%m-%d %H:%M')
+            # 3. Screening.__post_init__ validates (and parses) the time once
+            new_screening = Screening(movie_title=movie.title, screening_time=screening_time, total_seats=total_seats)
         except ValueError:
             return None # Invalid time format
-            
-        # 2. Find movie by exact title
-        found_movies = [m for m in self._movies if m.title.lower() == movie_title.lower()]
-        
-        # 3. Check for ambiguity or no-match
-        if len(found_movies) != 1:
-            return None # Movie not found or title is ambiguous
-        
-        movie = found_movies[0]
-        new_screening = Screening(movie_title=movie.title, screening_time=screening_time, total_seats=total_seats)
-        self.screenings.append(new_screening)
+        bucket = self._screenings_by_movie.setdefault(new_screening._movie_title_lower, [])
+        bisect.insort(bucket, new_screening, key=lambda s: s._ts)
+        self._screenings_by_id[new_screening.screening_id] = new_screening
         return new_screening
 
     def get_screenings_for_movie(self, movie_title: str) -> List[Screening]:
@@ -201,15 +329,14 @@ class CinemaManager:
         @brief Gets all screenings for a movie, sorted chronologically.
         
         @details
-            Finds screenings by **exact** title match (case-insensitive)
-            and returns them sorted by `screening_time`.
+            Finds screenings by **exact** title match (case-insensitive).
+            The per-movie buckets are kept sorted on insert, so this is a
+            single dict lookup plus a list copy — no per-call sort.
             
         @param movie_title The exact movie title to search for.
         @return List[Screening] A chronologically sorted list of screenings (can be empty).
         """
-        found_screenings = [s for s in self.screenings if movie_title.lower() == s.movie_title.lower()]
-        # Sort by the time string
-        return sorted(found_screenings, key=lambda s: s.screening_time)
+        return list(self._screenings_by_movie.get(movie_title.lower(), ()))
 
     def get_screening_by_id(self, screening_id: str) -> Optional[Screening]:
         """!
@@ -218,10 +345,7 @@ class CinemaManager:
         @param screening_id The unique identifier (UUID) of the screening.
         @return Optional[Screening] The found `Screening` object or `None`.
         """
-        for screening in self.screenings:
-            if screening.screening_id == screening_id:
-                return screening
-        return None
+        return self._screenings_by_id.get(screening_id)
 
 
     def book_tickets(self, screening_id: str, num_tickets: int) -> Optional[Booking]:
@@ -240,17 +364,29 @@ class CinemaManager:
             or `None` if validation fails.
         @see Booking, Screening.available_seats
         """
-        # 1. Validate input type
+        # Type check belongs at the API boundary only; trusted internal
+        # callers go straight to _book_tickets_fast.
         if not isinstance(num_tickets, int):
             return None
+        return self._book_tickets_fast(screening_id, num_tickets)
 
-        screening = self.get_screening_by_id(screening_id)
+    def _book_tickets_fast(self, screening_id: str, num_tickets: int) -> Optional[Booking]:
+        """!
+        @brief Books tickets without the input-type check.
+        @details
+            Internal hot path shared by `book_tickets` and the batch API.
+            `num_tickets` must already be known to be an `int`.
+        @param screening_id The ID of the screening to book.
+        @param num_tickets The number of tickets (an `int` > 0).
+        @return Optional[Booking] The created `Booking` or `None`.
+        """
+        screening = self._screenings_by_id.get(screening_id)
         
-        # 2. Validate screening existence
+        # 1. Validate screening existence
         if not screening:
             return None
         
-        # 3. Validate ticket count and availability
+        # 2. Validate ticket count and availability
         if not (0 < num_tickets <= screening.available_seats):
             return None
         
@@ -263,9 +399,35 @@ class CinemaManager:
             movie_title=screening.movie_title,
             num_tickets=num_tickets
         )
-        self.bookings.append(new_booking)
+        self.bookings[new_booking.booking_id] = new_booking
         return new_booking
 
+    def book_tickets_bulk(self, requests: List[tuple]) -> List[Optional[Booking]]:
+        """!
+        @brief Books tickets for a whole batch of requests in one call.
+
+        @details
+            Batch counterpart of `book_tickets`: the per-request validation
+            is identical, but the method/attribute lookups that dominate a
+            Python loop are hoisted into locals once, so the per-item cost
+            is a dict probe, a range check and one `Booking` allocation.
+
+        @param requests An iterable of `(screening_id, num_tickets)` pairs.
+        @return List[Optional[Booking]]
+            One entry per request, in order: the created `Booking`, or
+            `None` where that request failed validation.
+        @see book_tickets()
+        """
+        book_fast = self._book_tickets_fast
+        results: List[Optional[Booking]] = []
+        append = results.append
+        for screening_id, num_tickets in requests:
+            if not isinstance(num_tickets, int):
+                append(None)
+            else:
+                append(book_fast(screening_id, num_tickets))
+        return results
+
     def cancel_booking(self, booking_id: str) -> bool:
         """!
         @brief Cancels an existing booking by its ID.
@@ -283,8 +445,8 @@ class CinemaManager:
         
         @return bool `True` if cancellation was successful, `False` otherwise.
         """
-        booking_to_cancel = next((b for b in self.bookings if b.booking_id == booking_id), None)
-        
+        booking_to_cancel = self.bookings.pop(booking_id, None)
+
         if not booking_to_cancel:
             return False
 
@@ -293,5 +455,4 @@ class CinemaManager:
             # Return seats, ensuring the count cannot go below zero
             screening.booked_seats = max(0, screening.booked_seats - booking_to_cancel.num_tickets)
         
-        self.bookings.remove(booking_to_cancel)
         return True
\ No newline at end of file
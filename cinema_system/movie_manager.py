@@ -15,22 +15,45 @@
 @see main.py
 """
 
+import bisect
+import itertools
 import json
-import uuid
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Any
+import re
+import sys
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any
+
+try:
+    import orjson  # Optional C-accelerated JSON encoder.
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 # --- Data Classes ---
 
-@dataclass
+## Chronological key for screening buckets, bound once at import;
+## attrgetter runs in C, avoiding a lambda frame per compared element.
+_BY_TIME = attrgetter('_ts')
+
+## Screening-time shape, compiled once at import. Matching against this
+## and handing the digit groups to the datetime constructor skips the
+## _strptime layer that re-interprets the format string on every call.
+_TIME_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})$')
+
+@dataclass(slots=True, frozen=True)
 class Movie:
     """!
     @brief A data container class (dataclass) for representing a movie.
-    
+
     @details
         Stores all key information about a movie, such as title, year,
         director, genres, actors, runtime, and rating.
         Performs validation on the data immediately after object creation.
+        Instances are immutable (`frozen=True`) and slotted, so they carry
+        no per-instance `__dict__`.
     """
     title: str              ##< The title of the movie.
     year: int               ##< The release year of the movie.
@@ -39,6 +62,9 @@ class Movie:
     actors: List[str] = field(default_factory=list)     ##< A list of main actors.
     runtime_minutes: int = 0  ##< The runtime of the movie in minutes.
     rating: float = 0.0     ##< The movie's rating (e.g., out of 10.0).
+    _title_cf: str = field(init=False, repr=False, compare=False)    ##< Cached casefolded title.
+    _genres_str: str = field(init=False, repr=False, compare=False)   ##< Cached ", "-joined genres.
+    _as_tuple: tuple = field(init=False, repr=False, compare=False)   ##< Cached flat serialization view.
 
     def __post_init__(self):
         """!
@@ -53,43 +79,139 @@ class Movie:
         @throws ValueError If the release year is earlier than 1888 (the first film).
         @throws ValueError If the film runtime is negative.
         """
-        if not (0 <= self.rating <= 10):
-            raise ValueError("Rating must be between 0 and 10.")
-        if self.year < 1888:
-            raise ValueError("Movie release year cannot be earlier than 1888.")
-        if self.runtime_minutes < 0:
+        # Happy path takes a single combined test; the per-field checks
+        # that pick the specific message only run on invalid data. The
+        # negated chain keeps NaN ratings invalid (their comparisons are
+        # all False, so the `and` chain fails and we fall through).
+        if not (0 <= self.rating <= 10 and self.year >= 1888 and self.runtime_minutes >= 0):
+            if not (0 <= self.rating <= 10):
+                raise ValueError("Rating must be between 0 and 10.")
+            if self.year < 1888:
+                raise ValueError("Movie release year cannot be earlier than 1888.")
             raise ValueError("Movie runtime cannot be negative.")
+        self._cache_derived()
+
+    def _cache_derived(self) -> None:
+        """!
+        @brief Caches the invariant derived attributes.
+
+        @details
+            Populates the casefolded title, pre-joined genre string, and
+            flat serialization tuple. `object.__setattr__` is required
+            because the dataclass is frozen.
+        """
+        # Interned so the by-title dict probes hit pointer equality first
+        # and equal titles share one allocation.
+        object.__setattr__(self, '_title_cf', sys.intern(self.title.casefold()))
+        object.__setattr__(self, '_genres_str', ", ".join(self.genres))
+        object.__setattr__(self, '_as_tuple', (
+            self.title, self.year, self.director, tuple(self.genres),
+            tuple(self.actors), self.runtime_minutes, self.rating
+        ))
+
+    @classmethod
+    def _unchecked(cls, title: str, year: int, director: str,
+                   genres: Optional[List[str]] = None,
+                   actors: Optional[List[str]] = None,
+                   runtime_minutes: int = 0, rating: float = 0.0) -> "Movie":
+        """!
+        @brief Fast constructor for trusted, known-valid data.
 
-@dataclass
+        @details
+            Builds the instance with `object.__new__` and direct slot
+            assignment, skipping `__init__`/`__post_init__` validation.
+            Only for hard-coded or already-validated sources such as the
+            default catalog; user-submitted data must go through the
+            regular constructor.
+
+        @return Movie The constructed movie.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, 'title', title)
+        object.__setattr__(obj, 'year', year)
+        object.__setattr__(obj, 'director', director)
+        object.__setattr__(obj, 'genres', genres if genres is not None else [])
+        object.__setattr__(obj, 'actors', actors if actors is not None else [])
+        object.__setattr__(obj, 'runtime_minutes', runtime_minutes)
+        object.__setattr__(obj, 'rating', rating)
+        obj._cache_derived()
+        return obj
+
+    def as_tuple(self) -> tuple:
+        """!
+        @brief Returns the movie as a flat attribute tuple.
+
+        @details
+            Cheap export view for serializers and tabular consumers:
+            hands back the tuple precomputed at construction instead of
+            walking the dataclass recursively the way `dataclasses.asdict`
+            does (a fresh dict allocation per call).
+
+        @return tuple `(title, year, director, genres, actors, runtime_minutes, rating)`.
+        """
+        return self._as_tuple
+
+    def to_json_bytes(self) -> bytes:
+        """!
+        @brief Serializes the movie as a flat JSON array.
+
+        @details
+            Encodes the tuple view precomputed in `__post_init__` instead of
+            walking the dataclass with `asdict` (which recursively allocates
+            a fresh dict per call). Uses `orjson` when available, falling
+            back to the standard `json` module.
+
+        @return bytes The UTF-8 encoded JSON representation.
+        """
+        if orjson is not None:
+            return orjson.dumps(self._as_tuple)
+        return json.dumps(self._as_tuple).encode('utf-8')
+
+@dataclass(slots=True, eq=False)
 class Screening:
     """!
     @brief A data container class (dataclass) for representing a movie screening.
-    
+
     @details
         Stores information about the movie title, screening time,
         total seats, and booked seats.
-        Automatically generates a unique `screening_id` (UUIDv4) upon creation.
+        The `screening_id` is assigned by `CinemaManager` from a cheap
+        process-local counter (no RNG syscall per screening).
+        `eq=False`: a screening is an entity identified by its ID, so
+        comparison and hashing use object identity instead of a
+        field-by-field walk.
     """
     movie_title: str        ##< The title of the movie being shown.
     screening_time: str     ##< The time of the screening (e.g., "2023-10-27 19:00").
     total_seats: int        ##< The total number of seats in the theater.
-    screening_id: str = field(default_factory=lambda: str(uuid.uuid4())) ##< Unique ID for the screening (UUIDv4).
+    screening_id: str       ##< Unique ID for the screening (manager-assigned).
     booked_seats: int = 0   ##< The number of seats already booked.
+    available_seats: int = field(init=False, repr=False, compare=False)  ##< Free seats, maintained on book/cancel.
+    _ts: int = field(init=False, repr=False, compare=False)  ##< Screening time as epoch seconds.
 
-    @property
-    def available_seats(self) -> int:
+    def __post_init__(self):
         """!
-        @brief A computed property to get the number of available seats.
-        
+        @brief Validates the time format and initializes derived state.
+
         @details
-            Dynamically calculates the number of free seats as the difference
-            between total seats and booked seats.
-            
-        @return int The number of available seats (total_seats - booked_seats).
+            Parses `screening_time` exactly once, keeping the result as
+            epoch seconds in `_ts` so chronological ordering compares
+            ints. `available_seats` is kept as a plain field updated by
+            `CinemaManager.book_tickets`/`cancel_booking`, so hot paths read
+            a slot instead of invoking a property and re-subtracting on
+            every access.
+
+        @throws ValueError If `screening_time` is not 'YYYY-MM-DD HH:MM'.
         """
-        return self.total_seats - self.booked_seats
+        match = _TIME_RE.match(self.screening_time)
+        if match is None:
+            raise ValueError(
+                f"time data {self.screening_time!r} does not match format '%Y-%m-%d %H:%M'")
+        # The datetime constructor still range-checks month/day/hour/minute.
+        self._ts = int(datetime(*map(int, match.groups())).timestamp())
+        self.available_seats = self.total_seats - self.booked_seats
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Booking:
     """!
     @brief A data container class (dataclass) for representing a booking.
@@ -97,38 +219,55 @@ class Booking:
     @details
         Stores a reference to the screening ID, the movie title, and
         the number of tickets booked.
-        Automatically generates a unique `booking_id` (UUIDv4) upon creation.
+        The `booking_id` is assigned by `CinemaManager` from a cheap
+        process-local counter (no RNG syscall per booking).
+        `eq=False`: a booking is an entity identified by its ID, so
+        comparison and hashing use object identity instead of a
+        field-by-field walk.
     """
     screening_id: str       ##< The ID of the screening being booked.
     movie_title: str        ##< The title of the movie (for convenience).
     num_tickets: int        ##< The number of tickets booked.
-    booking_id: str = field(default_factory=lambda: str(uuid.uuid4())) ##< Unique ID for the booking (UUIDv4).
+    booking_id: str         ##< Unique ID for the booking (manager-assigned).
 
 
 # --- Helper Function ---
 
+## Raw rows of the default catalog: plain positional data with no object
+## construction cost until the single comprehension below runs. The same
+## layout suits any future bulk source (CSV import rows, fixtures).
+_DEFAULT_DATA = (
+    ("The Shawshank Redemption", 1994, "Frank Darabont", ["Drama"], ["Tim Robbins", "Morgan Freeman"], 142, 9.3),
+    ("The Godfather", 1972, "Francis Ford Coppola", ["Crime", "Drama"], ["Marlon Brando", "Al Pacino"], 175, 9.2),
+    ("The Dark Knight", 2008, "Christopher Nolan", ["Action", "Crime", "Drama"], ["Christian Bale", "Heath Ledger"], 152, 9.0),
+    ("Pulp Fiction", 1994, "Quentin Tarantino", ["Crime", "Drama"], ["John Travolta", "Uma Thurman", "Samuel L. Jackson"], 154, 8.9),
+    ("Forrest Gump", 1994, "Robert Zemeckis", ["Drama", "Romance"], ["Tom Hanks", "Robin Wright"], 142, 8.8),
+    ("Inception", 2010, "Christopher Nolan", ["Action", "Adventure", "Sci-Fi"], ["Leonardo DiCaprio", "Joseph Gordon-Levitt"], 148, 8.8),
+    ("The Matrix", 1999, "Lana Wachowski", ["Action", "Sci-Fi"], ["Keanu Reeves", "Laurence Fishburne"], 136, 8.7),
+    ("Fight Club", 1999, "David Fincher", ["Drama"], ["Brad Pitt", "Edward Norton"], 139, 8.8),
+    ("Goodfellas", 1990, "Martin Scorsese", ["Biography", "Crime", "Drama"], ["Robert De Niro", "Ray Liotta", "Joe Pesci"], 146, 8.7),
+    ("Parasite", 2019, "Bong Joon Ho", ["Comedy", "Drama", "Thriller"], ["Song Kang-ho", "Lee Sun-kyun"], 132, 8.6),
+)
+
+## The default catalog, materialized once at import through the trusted
+## constructor (the rows above are known-valid, so validation is skipped).
+_DEFAULT_MOVIES: Tuple[Movie, ...] = tuple(Movie._unchecked(*row) for row in _DEFAULT_DATA)
+
+
 def create_default_movies() -> List[Movie]:
     """!
-    @brief Creates and returns an initial collection of 10 movies.
-    
+    @brief Returns the initial collection of 10 movies.
+
     @details
         Used for the initial population of `CinemaManager`
         if no other list of movies is provided.
-        
+        The movies are built and validated once at module import; since
+        `Movie` is frozen, every caller gets a cheap shallow copy of the
+        cached tuple instead of re-running ten constructions.
+
     @return List[Movie] A list of `Movie` objects.
     """
-    return [
-        Movie("The Shawshank Redemption", 1994, "Frank Darabont", ["Drama"], ["Tim Robbins", "Morgan Freeman"], 142, 9.3),
-        Movie("The Godfather", 1972, "Francis Ford Coppola", ["Crime", "Drama"], ["Marlon Brando", "Al Pacino"], 175, 9.2),
-        Movie("The Dark Knight", 2008, "Christopher Nolan", ["Action", "Crime", "Drama"], ["Christian Bale", "Heath Ledger"], 152, 9.0),
-        Movie("Pulp Fiction", 1994, "Quentin Tarantino", ["Crime", "Drama"], ["John Travolta", "Uma Thurman", "Samuel L. Jackson"], 154, 8.9),
-        Movie("Forrest Gump", 1994, "Robert Zemeckis", ["Drama", "Romance"], ["Tom Hanks", "Robin Wright"], 142, 8.8),
-        Movie("Inception", 2010, "Christopher Nolan", ["Action", "Adventure", "Sci-Fi"], ["Leonardo DiCaprio", "Joseph Gordon-Levitt"], 148, 8.8),
-        Movie("The Matrix", 1999, "Lana Wachowski", ["Action", "Sci-Fi"], ["Keanu Reeves", "Laurence Fishburne"], 136, 8.7),
-        Movie("Fight Club", 1999, "David Fincher", ["Drama"], ["Brad Pitt", "Edward Norton"], 139, 8.8),
-        Movie("Goodfellas", 1990, "Martin Scorsese", ["Biography", "Crime", "Drama"], ["Robert De Niro", "Ray Liotta", "Joe Pesci"], 146, 8.7),
-        Movie("Parasite", 2019, "Bong Joon Ho", ["Comedy", "Drama", "Thriller"], ["Song Kang-ho", "Lee Sun-kyun"], 132, 8.6)
-    ]
+    return list(_DEFAULT_MOVIES)
 
 
 # --- Main Service Class ---
@@ -175,8 +314,45 @@ class CinemaManager:
         @see create_default_movies()
         """
         self._movies: List[Movie] = movies if movies is not None else create_default_movies()
-        self.screenings: List[Screening] = []
-        self.bookings: List[Booking] = []
+        # Derived indexes over the catalog, kept in sync by _index_movie().
+        self._movies_by_lower_title: Dict[str, List[Movie]] = defaultdict(list)
+        self._movie_keys: Set[Tuple[str, int]] = set()
+        # Memoized search results keyed by casefolded query; invalidated
+        # whenever the catalog changes.
+        self._find_cache: Dict[str, Tuple[Movie, ...]] = {}
+        for movie in self._movies:
+            self._index_movie(movie)
+        # Keyed by ID; dict ordering preserves insertion order for listing.
+        self.screenings: Dict[str, Screening] = {}
+        self.bookings: Dict[str, Booking] = {}
+        # Screenings grouped by casefolded movie title, each bucket kept
+        # chronologically sorted on insert, so schedule queries are a dict
+        # probe instead of a scan plus sort over every screening.
+        self._screenings_by_title: Dict[str, List[Screening]] = defaultdict(list)
+        # Dense int32 mirrors of the per-screening seat counters (SoA
+        # layout): 4 bytes per value instead of a boxed Python int, and
+        # aggregations run over contiguous memory.
+        self._seat_total = array('i')
+        self._seat_booked = array('i')
+        self._screening_idx: Dict[str, int] = {}
+        # Monotonic ID generators; an internal system does not need
+        # cryptographically random IDs, and uuid4() costs a syscall each.
+        self._sid = itertools.count(1)
+        self._bid = itertools.count(1)
+
+    def _index_movie(self, movie: Movie) -> None:
+        """!
+        @brief Registers a movie in the derived lookup structures.
+
+        @details
+            Updates the casefolded-title dictionary and the duplicate-detection
+            key set. Must be called for every movie that enters `self._movies`.
+
+        @param movie The `Movie` object to index.
+        @return None
+        """
+        self._movies_by_lower_title[movie._title_cf].append(movie)
+        self._movie_keys.add((movie._title_cf, movie.year))
 
     def get_all_movies(self) -> List[Movie]:
         """!
@@ -200,10 +376,34 @@ class CinemaManager:
         @param movie The `Movie` object to add.
         @return None
         """
-        for m in self._movies:
-            if m.title.lower() == movie.title.lower() and m.year == movie.year:
-                return  # Ignore if duplicate
+        if (movie._title_cf, movie.year) in self._movie_keys:
+            return  # Ignore if duplicate
         self._movies.append(movie)
+        self._index_movie(movie)
+        # The catalog changed, so memoized search results are stale.
+        self._find_cache.clear()
+
+    def add_movies(self, movies: Iterable[Movie]) -> None:
+        """!
+        @brief Adds a batch of movies in a single deduplicating pass.
+
+        @details
+            Equivalent to calling `add_movie` per element, but performs the
+            duplicate check against the key set in one O(n) loop and
+            invalidates the search cache once at the end, so bulk imports
+            stay linear instead of re-scanning per insert.
+
+        @param movies An iterable of `Movie` objects to add.
+        @return None
+        @see add_movie
+        """
+        keys = self._movie_keys
+        for movie in movies:
+            if (movie._title_cf, movie.year) in keys:
+                continue
+            self._movies.append(movie)
+            self._index_movie(movie)
+        self._find_cache.clear()
 
     def find_movie_by_title(self, title_query: str) -> List[Movie]:
         """!
@@ -212,12 +412,37 @@ class CinemaManager:
         @details
             The search is case-insensitive.
             It checks if `title_query` is a substring of the movie titles.
-            
+            Results are memoized per query until the catalog changes, so
+            repeated interactive searches skip the scan entirely.
+
         @param title_query The string to search for in movie titles.
         @return List[Movie] A list of movies matching the query (can be empty).
         """
-        return [m for m in self._movies if title_query.lower() in m.title.lower()]
+        query_cf = title_query.casefold()
+        cached = self._find_cache.get(query_cf)
+        if cached is None:
+            cached = tuple(m for m in self._movies if query_cf in m._title_cf)
+            self._find_cache[query_cf] = cached
+        return list(cached)
+
 
+    def find_movies_containing_any(self, terms: List[str]) -> List[Movie]:
+        """!
+        @brief Finds movies whose title contains any of the given terms.
+
+        @details
+            All terms are casefolded once up front and the catalog is
+            scanned a single time, so a multi-term query costs one pass
+            instead of one `find_movie_by_title` scan per term. Each
+            matching movie is returned once, in catalog order.
+
+        @param terms The substrings to search for (case-insensitive).
+        @return List[Movie] The movies matching at least one term.
+        @see find_movie_by_title
+        """
+        terms_cf = [t.casefold() for t in terms]
+        return [m for m in self._movies
+                if any(t in m._title_cf for t in terms_cf)]
 
     def add_screening(self, movie_title: str, screening_time: str, total_seats: int) -> Optional[Screening]:
         """!
@@ -226,11 +451,12 @@ class CinemaManager:
         @details
             Searches for a movie by its **exact** title (case-insensitive).
             If the movie is found, creates a new `Screening` object
-            and adds it to the `self.screenings` list.
+            and stores it in `self.screenings` under its ID.
             
         @note
             If multiple movies exist with the same title
-            (e.g., remakes), this method will add the screening for the first one found.
+            (e.g., remakes), the request is ambiguous and is rejected
+            with `None` rather than silently picking one of them.
             
         @param movie_title The exact title of the movie.
         @param screening_time The screening time as a string (e.g., "2025-10-28 21:00").
@@ -238,23 +464,34 @@ class CinemaManager:
         
         @return Optional[Screening]
             The created `Screening` object on success,
-            or `None` if the movie was not found.
+            or `None` if the movie was not found or the time is malformed.
         @see Screening
         """
-        # Find movie by exact title
-        found_movies = [m for m in self._movies if m.title.lower() == movie_title.lower()]
-        if not found_movies:
-            return None  # Movie not found
-        
+        # Find movie by exact title via the casefolded-title index; the
+        # bucket length distinguishes not-found (0) from ambiguous (>1).
+        found_movies = self._movies_by_lower_title.get(movie_title.casefold(), ())
+        if len(found_movies) != 1:
+            return None  # Movie not found or title is ambiguous
+
         # Use the canonical movie title (with correct capitalization)
         canonical_title = found_movies[0].title
         
-        new_screening = Screening(
-            movie_title=canonical_title, 
-            screening_time=screening_time, 
-            total_seats=total_seats
-        )
-        self.screenings.append(new_screening)
+        try:
+            # Screening.__post_init__ validates (and parses) the time once
+            new_screening = Screening(
+                movie_title=canonical_title,
+                screening_time=screening_time,
+                total_seats=total_seats,
+                screening_id=f"S{next(self._sid)}"
+            )
+        except ValueError:
+            return None  # Invalid time format
+        self.screenings[new_screening.screening_id] = new_screening
+        bisect.insort(self._screenings_by_title[found_movies[0]._title_cf],
+                      new_screening, key=_BY_TIME)
+        self._screening_idx[new_screening.screening_id] = len(self._seat_total)
+        self._seat_total.append(total_seats)
+        self._seat_booked.append(0)
         return new_screening
 
     def get_screenings_for_movie(self, movie_title: str) -> List[Screening]:
@@ -262,26 +499,25 @@ class CinemaManager:
         @brief Gets all screenings for a specific movie.
         
         @details
-            The search is performed using a **partial** title match
-            (case-insensitive). This differs from `add_screening`.
+            The search uses an **exact** title match (case-insensitive),
+            the same rule as `add_screening`, and is served from the
+            per-title index with a single dict probe. Buckets are kept
+            chronologically sorted on insert, so no per-call sort runs.
             
-        @param movie_title The movie title to search for (can be partial).
+        @param movie_title The exact movie title to search for.
         @return List[Screening] A list of screenings for that movie (can be empty).
         @see add_screening
         """
-        return [s for s in self.screenings if movie_title.lower() in s.movie_title.lower()]
+        return list(self._screenings_by_title.get(movie_title.casefold(), ()))
 
     def get_screening_by_id(self, screening_id: str) -> Optional[Screening]:
         """!
         @brief Finds a screening by its unique ID.
         
-        @param screening_id The unique identifier (UUID) of the screening.
+        @param screening_id The unique identifier of the screening.
         @return Optional[Screening] The found `Screening` object or `None`.
         """
-        for screening in self.screenings:
-            if screening.screening_id == screening_id:
-                return screening
-        return None
+        return self.screenings.get(screening_id)
 
 
     def book_tickets(self, screening_id: str, num_tickets: int) -> Optional[Booking]:
@@ -304,28 +540,95 @@ class CinemaManager:
             number of tickets).
         @see Booking, Screening.available_seats
         """
+        # Validation 1: The count must be a plain positive int. The
+        # exact-type test is one pointer compare (no isinstance MRO walk)
+        # and also rejects bools and strings up front.
+        if type(num_tickets) is not int or num_tickets <= 0:
+            return None
+
         screening = self.get_screening_by_id(screening_id)
         
-        # Validation 1: Screening must exist
+        # Validation 2: Screening must exist
         if not screening:
             return None
         
-        # Validation 2: Must book a positive number of tickets and seats must be available
-        if not (0 < num_tickets <= screening.available_seats):
+        # Validation 3: Enough seats must be free; available_seats is a
+        # stored slot, so this is a plain attribute read.
+        if num_tickets > screening.available_seats:
             return None
         
-        # Update state
+        # Update state (keep the stored free-seat counter and the
+        # dense seat mirror in sync)
         screening.booked_seats += num_tickets
-        
+        screening.available_seats -= num_tickets
+        self._seat_booked[self._screening_idx[screening_id]] = screening.booked_seats
+
         # Create booking record
         new_booking = Booking(
-            screening_id=screening_id, 
+            screening_id=screening_id,
             movie_title=screening.movie_title,
-            num_tickets=num_tickets
+            num_tickets=num_tickets,
+            booking_id=f"B{next(self._bid)}"
         )
-        self.bookings.append(new_booking)
+        self.bookings[new_booking.booking_id] = new_booking
         return new_booking
 
+    def get_total_available_seats(self) -> int:
+        """!
+        @brief Sums the free seats across all screenings.
+
+        @details
+            Computed from the dense int32 seat mirrors, so the aggregation
+            iterates two contiguous arrays instead of fetching two
+            attributes per `Screening` object.
+
+        @return int The total number of bookable seats.
+        """
+        return sum(self._seat_total) - sum(self._seat_booked)
+
+    def book_tickets_bulk(self, requests: List[Tuple[str, int]]) -> List[Optional[Booking]]:
+        """!
+        @brief Books tickets for a whole batch of requests in one call.
+
+        @details
+            Processes `(screening_id, num_tickets)` pairs in a single tight
+            loop with the screening dict and ID counter bound to locals, so
+            replay/simulation drivers pay the method-call and lookup
+            overhead once per batch instead of once per booking.
+
+        @param requests A list of `(screening_id, num_tickets)` pairs.
+        @return List[Optional[Booking]]
+            Per-request results in input order: the created `Booking`,
+            or `None` where that request failed validation.
+        @see book_tickets
+        """
+        results: List[Optional[Booking]] = []
+        screenings = self.screenings
+        bookings = self.bookings
+        seat_booked = self._seat_booked
+        screening_idx = self._screening_idx
+        next_bid = self._bid.__next__
+        for screening_id, num_tickets in requests:
+            if type(num_tickets) is not int or num_tickets <= 0:
+                results.append(None)
+                continue
+            screening = screenings.get(screening_id)
+            if screening is None or num_tickets > screening.available_seats:
+                results.append(None)
+                continue
+            screening.booked_seats += num_tickets
+            screening.available_seats -= num_tickets
+            seat_booked[screening_idx[screening_id]] = screening.booked_seats
+            new_booking = Booking(
+                screening_id=screening_id,
+                movie_title=screening.movie_title,
+                num_tickets=num_tickets,
+                booking_id=f"B{next_bid()}"
+            )
+            bookings[new_booking.booking_id] = new_booking
+            results.append(new_booking)
+        return results
+
     def cancel_booking(self, booking_id: str) -> bool:
         """!
         @brief Cancels an existing booking by its ID.
@@ -334,7 +637,7 @@ class CinemaManager:
             Finds the booking by `booking_id`. If found,
             it locates the corresponding screening and returns
             the booked tickets (decrements `booked_seats`).
-            It then removes the `Booking` object from the `self.bookings` list.
+            The `Booking` object is removed from `self.bookings` by its key.
             
         @note
             If the screening associated with the booking was deleted,
@@ -348,20 +651,21 @@ class CinemaManager:
         @return bool `True` if the booking was successfully found
                      and canceled, `False` otherwise.
         """
-        # Find the booking by ID
-        booking_to_cancel = next((b for b in self.bookings if b.booking_id == booking_id), None)
-        
+        # Find and remove the booking by ID in a single dict operation
+        booking_to_cancel = self.bookings.pop(booking_id, None)
+
         if not booking_to_cancel:
             return False  # Booking not found
 
         # Find the corresponding screening
         screening = self.get_screening_by_id(booking_to_cancel.screening_id)
-        
+
         # Return the seats if the screening still exists
         if screening:
-            # Return seats, ensuring the count cannot go below zero
+            # Return seats, ensuring the count cannot go below zero,
+            # and re-derive the stored free-seat counter from the invariant
             screening.booked_seats = max(0, screening.booked_seats - booking_to_cancel.num_tickets)
-        
-        # Remove the booking
-        self.bookings.remove(booking_to_cancel)
+            screening.available_seats = screening.total_seats - screening.booked_seats
+            self._seat_booked[self._screening_idx[screening.screening_id]] = screening.booked_seats
+
         return True
\ No newline at end of file
@@ -17,20 +17,57 @@
 
 """
 
+import bisect
 import json
-import uuid
+import sys
+from array import array
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from operator import attrgetter, index as _as_index
+from uuid import uuid4
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _parse_screening_time(value: str) -> datetime:
+    """!
+    @brief Parses a 'YYYY-MM-DD HH:MM' string with fixed offsets.
+
+    @details
+        `datetime.strptime` routes through `_strptime` and its regex
+        machinery on every call; for a single fixed format, slicing the
+        digits out at known offsets and letting `int()` / the `datetime`
+        constructor reject anything malformed is several times faster.
+        Schedules repeat the same slots heavily (daily 19:00 shows), so
+        results are memoized: repeated strings cost one dict hit, and
+        the returned `datetime` is immutable so sharing it is safe.
+
+    @param value The time string to parse.
+    @return datetime The parsed value.
+    @throws ValueError If `value` does not match 'YYYY-MM-DD HH:MM'.
+    """
+    if (len(value) != 16 or value[4] != '-' or value[7] != '-'
+            or value[10] != ' ' or value[13] != ':'):
+        raise ValueError(f"time data {value!r} does not match format '%Y-%m-%d %H:%M'")
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                    int(value[11:13]), int(value[14:16]))
+
+
+## Sort key for chronological screening order, bound once at import;
+## attrgetter runs in C, avoiding a lambda frame per compared element.
+_BY_TIME_KEY = attrgetter('_time_key')
+
+
+@dataclass(slots=True, frozen=True)
 class Movie:
     """!
     @brief A data container class (dataclass) for representing a movie.
     
     @details
-        Stores all key information about a movie.
+        Stores all key information about a movie; instances are frozen,
+        so a movie is an immutable record once created.
         Performs validation on the data immediately after object creation
         using the `__post_init__` method.
     """
@@ -41,6 +78,7 @@ class Movie:
     actors: List[str] = field(default_factory=list)
     runtime_minutes: int = 0
     rating: float = 0.0
+    _title_lower: str = field(init=False, repr=False, compare=False)  ##< Cached lowercase title.
 
     def __post_init__(self):
         """!
@@ -62,8 +100,16 @@ class Movie:
             raise ValueError("Movie release year cannot be earlier than 1888.")
         if self.runtime_minutes < 0:
             raise ValueError("Movie runtime cannot be negative.")
+        # Intern the strings that repeat across a catalog (directors,
+        # genres, actors) so duplicates share one allocation and compare
+        # by pointer first.
+        object.__setattr__(self, 'director', sys.intern(self.director))
+        object.__setattr__(self, 'genres', [sys.intern(g) for g in self.genres])
+        object.__setattr__(self, 'actors', [sys.intern(a) for a in self.actors])
+        # Cache the lowercase title once so searches stop re-lowering it.
+        object.__setattr__(self, '_title_lower', self.title.lower())
 
-@dataclass
+@dataclass(slots=True)
 class Screening:
     """!
     @brief A data container class (dataclass) for representing a movie screening.
@@ -76,8 +122,27 @@ class Screening:
     movie_title: str
     screening_time: str
     total_seats: int
-    screening_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    screening_id: Optional[str] = None
     booked_seats: int = 0
+    _movie_title_lower: str = field(init=False, repr=False, compare=False)  ##< Cached lowercase movie title.
+    _time_key: int = field(init=False, repr=False, compare=False)  ##< Screening time as epoch seconds.
+
+    def __post_init__(self):
+        """!
+        @brief Validates the time format and caches derived values.
+        @details
+            Parses `screening_time` exactly once and stores it as epoch
+            seconds in `_time_key`, so chronological sorting compares
+            ints instead of strings.
+        @throws ValueError If `screening_time` is not 'YYYY-MM-DD HH:MM'.
+        """
+        if self.screening_id is None:
+            # Direct uuid4().hex skips both the default_factory lambda
+            # frame and the dash-formatting str(UUID) path.
+            self.screening_id = uuid4().hex
+        parsed = _parse_screening_time(self.screening_time)
+        object.__setattr__(self, '_time_key', int(parsed.timestamp()))
+        object.__setattr__(self, '_movie_title_lower', self.movie_title.lower())
 
     @property
     def available_seats(self) -> int:
@@ -87,7 +152,7 @@ class Screening:
         """
         return self.total_seats - self.booked_seats
 
-@dataclass
+@dataclass(slots=True)
 class Booking:
     """!
     @brief A data container class (dataclass) for representing a booking.
@@ -100,7 +165,14 @@ class Booking:
     screening_id: str
     movie_title: str
     num_tickets: int
-    booking_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    booking_id: Optional[str] = None
+
+    def __post_init__(self):
+        """!
+        @brief Generates a booking ID when one was not supplied.
+        """
+        if self.booking_id is None:
+            self.booking_id = uuid4().hex
 
 def create_default_movies() -> List[Movie]:
     """!
@@ -126,6 +198,12 @@ def create_default_movies() -> List[Movie]:
     ]
 
 
+## Default catalog built once at import. Movie records are frozen, so
+## handing the same instances to every manager is safe; each manager
+## still gets its own list so add_movie never mutates the template.
+_DEFAULT_MOVIES_TEMPLATE: Tuple[Movie, ...] = tuple(create_default_movies())
+
+
 class CinemaManager:
     """!
     @brief The main class for managing the cinema's operations.
@@ -158,9 +236,53 @@ class CinemaManager:
             If `None`, the default list from `create_default_movies()` will be used.
         @see create_default_movies()
         """
-        self._movies: List[Movie] = movies if movies is not None else create_default_movies()
+        self._movies: List[Movie] = movies if movies is not None else list(_DEFAULT_MOVIES_TEMPLATE)
+        # Movie indexes: duplicate checks probe _movies_by_key, and
+        # add_screening resolves exact titles (including the ambiguity
+        # rule) through _movies_by_lower_title. Both are maintained by
+        # add_movie.
+        self._movies_by_key: Dict[Tuple[str, int], Movie] = {}
+        self._movies_by_lower_title: Dict[str, List[Movie]] = {}
+        # Trigram inverted index: every 3-char window of a lowered title
+        # maps to the set of catalog positions containing it; substring
+        # searches intersect these buckets to shortlist candidates.
+        self._trigram_index: Dict[str, set] = defaultdict(set)
+        for i, m in enumerate(self._movies):
+            self._movies_by_key[(m._title_lower, m.year)] = m
+            self._movies_by_lower_title.setdefault(m._title_lower, []).append(m)
+            self._add_trigrams(m._title_lower, i)
         self.screenings: List[Screening] = []
-        self.bookings: List[Booking] = []
+        # Screenings bucketed by lowercase movie title; each bucket is
+        # kept chronologically sorted on insert, so schedule queries
+        # never re-sort.
+        self._screenings_by_title_lower: Dict[str, List[Screening]] = defaultdict(list)
+        # Bookings keyed by booking_id: creation and cancellation become
+        # O(1) dict operations instead of linear list scans.
+        self._bookings: Dict[str, Booking] = {}
+        # Cancelled Booking instances are parked here and recycled by
+        # _new_booking, sparing allocator and GC churn during
+        # book-and-cancel bursts.
+        self._booking_pool: List[Booking] = []
+        # By-ID index over `screenings`, maintained by add_screening, so
+        # get_screening_by_id is a hash probe instead of a linear scan.
+        self._screenings_by_id: Dict[str, Screening] = {}
+        # Structure-of-arrays mirror of the seat counters: contiguous C
+        # ints that aggregate queries can sum without touching one
+        # Screening object per row. _screening_index maps a screening_id
+        # to its slot in both arrays.
+        self._seat_total = array('i')
+        self._seat_booked = array('i')
+        self._screening_index: Dict[str, int] = {}
+
+    @property
+    def bookings(self) -> List[Booking]:
+        """!
+        @brief All current bookings, in insertion order.
+        @details Compatibility view over the internal by-ID dict, which
+            preserves insertion order.
+        @return List[Booking] A list of all `Booking` objects.
+        """
+        return list(self._bookings.values())
 
     def get_all_movies(self) -> List[Movie]:
         """!
@@ -183,22 +305,53 @@ class CinemaManager:
         @param movie The `Movie` object to add.
         @return None
         """
-        for m in self._movies:
-            if m.title.lower() == movie.title.lower() and m.year == movie.year:
-                return  # Ignore if duplicate
+        title_lower = movie._title_lower
+        key = (title_lower, movie.year)
+        if key in self._movies_by_key:
+            return  # Ignore if duplicate
+        self._movies_by_key[key] = movie
+        self._movies_by_lower_title.setdefault(title_lower, []).append(movie)
+        self._add_trigrams(title_lower, len(self._movies))
         self._movies.append(movie)
 
+    def _add_trigrams(self, title_lower: str, index: int) -> None:
+        """!
+        @brief Registers one title's 3-char windows in the trigram index.
+        @param title_lower The already-lowercased title.
+        @param index The position of the movie in `_movies`.
+        """
+        trigram_index = self._trigram_index
+        for j in range(len(title_lower) - 2):
+            trigram_index[title_lower[j:j + 3]].add(index)
+
     def find_movie_by_title(self, title_query: str) -> List[Movie]:
         """!
         @brief Finds movies by a partial title (substring match).
         
         @details
-            The search is case-insensitive.
+            The search is case-insensitive. Queries of three or more
+            characters intersect the trigram index buckets to shortlist
+            candidates and only verify those with a real substring check
+            (trigram overlap alone can produce false positives). Shorter
+            queries carry no complete trigram and fall back to the
+            linear scan.
             
         @param title_query The string to search for in movie titles.
         @return List[Movie] A list of movies matching the query (can be empty).
         """
-        return [m for m in self._movies if title_query.lower() in m.title.lower()]
+        query_lower = title_query.lower()
+        movies = self._movies
+        if len(query_lower) < 3:
+            return [m for m in movies if query_lower in m._title_lower]
+        trigram_index = self._trigram_index
+        candidate_sets = []
+        for j in range(len(query_lower) - 2):
+            bucket = trigram_index.get(query_lower[j:j + 3])
+            if not bucket:
+                return []  # Some trigram occurs in no title: no match possible.
+            candidate_sets.append(bucket)
+        candidates = sorted(set.intersection(*candidate_sets))
+        return [movies[i] for i in candidates if query_lower in movies[i]._title_lower]
 
     def add_screening(self, movie_title: str, screening_time: str, total_seats: int) -> Optional[Screening]:
         """!
@@ -219,22 +372,25 @@ class CinemaManager:
         
         @return Optional[Screening] The created `Screening` object, or `None` if validation fails.
         """
-        try:
-            # 1. Validate time format
-            datetime.strptime(screening_time, '%Y-%m-%d %H:%M')
-        except ValueError:
-            return None # Invalid time format
-            
-        # 2. Find movie by exact title
-        found_movies = [m for m in self._movies if m.title.lower() == movie_title.lower()]
-        
-        # 3. Check for ambiguity or no-match
+        # 1. Resolve the exact title with one dict probe; the bucket
+        #    length covers both the no-match and the ambiguity case.
+        found_movies = self._movies_by_lower_title.get(movie_title.lower(), ())
         if len(found_movies) != 1:
             return None # Movie not found or title is ambiguous
         
         movie = found_movies[0]
-        new_screening = Screening(movie_title=movie.title, screening_time=screening_time, total_seats=total_seats)
+        try:
+            # 2. Screening.__post_init__ validates (and parses) the time once
+            new_screening = Screening(movie_title=movie.title, screening_time=screening_time, total_seats=total_seats)
+        except ValueError:
+            return None # Invalid time format
         self.screenings.append(new_screening)
+        bisect.insort(self._screenings_by_title_lower[new_screening._movie_title_lower],
+                      new_screening, key=_BY_TIME_KEY)
+        self._screenings_by_id[new_screening.screening_id] = new_screening
+        self._screening_index[new_screening.screening_id] = len(self._seat_total)
+        self._seat_total.append(total_seats)
+        self._seat_booked.append(0)
         return new_screening
 
     def get_screenings_for_movie(self, movie_title: str) -> List[Screening]:
@@ -242,15 +398,14 @@ class CinemaManager:
         @brief Gets all screenings for a movie, sorted chronologically.
         
         @details
-            Finds screenings by **exact** title match (case-insensitive)
-            and returns them sorted by `screening_time`.
+            Finds screenings by **exact** title match (case-insensitive).
+            The per-title buckets are kept sorted on insert, so this is a
+            single dict lookup plus a list copy — no per-call sort.
             
         @param movie_title The exact movie title to search for.
         @return List[Screening] A chronologically sorted list of screenings (can be empty).
         """
-        found_screenings = [s for s in self.screenings if movie_title.lower() == s.movie_title.lower()]
-        # Sort by the time string
-        return sorted(found_screenings, key=lambda s: s.screening_time)
+        return list(self._screenings_by_title_lower.get(movie_title.lower(), ()))
 
     def get_screening_by_id(self, screening_id: str) -> Optional[Screening]:
         """!
@@ -259,10 +414,7 @@ class CinemaManager:
         @param screening_id The unique identifier (UUID) of the screening.
         @return Optional[Screening] The found `Screening` object or `None`.
         """
-        for screening in self.screenings:
-            if screening.screening_id == screening_id:
-                return screening
-        return None
+        return self._screenings_by_id.get(screening_id)
 
 
     def book_tickets(self, screening_id: str, num_tickets: int) -> Optional[Booking]:
@@ -281,9 +433,19 @@ class CinemaManager:
             or `None` if validation fails.
         @see Booking, Screening.available_seats
         """
-        # 1. Validate input type
-        if not isinstance(num_tickets, int):
-            return None
+        # 1. Validate input type. The exact-type test is one pointer
+        #    compare and covers the overwhelmingly common case of a plain
+        #    int; anything else is offered the __index__ protocol, so
+        #    int-like types from numeric libraries are accepted too.
+        #    Bools are still rejected: True has __index__ but booking
+        #    "True tickets" is a caller bug.
+        if type(num_tickets) is not int:
+            if isinstance(num_tickets, bool):
+                return None
+            try:
+                num_tickets = _as_index(num_tickets)
+            except TypeError:
+                return None
 
         screening = self.get_screening_by_id(screening_id)
         
@@ -297,16 +459,90 @@ class CinemaManager:
         
         # Update state
         screening.booked_seats += num_tickets
+        self._seat_booked[self._screening_index[screening_id]] = screening.booked_seats
         
-        # Create booking record
-        new_booking = Booking(
-            screening_id=screening_id, 
-            movie_title=screening.movie_title,
-            num_tickets=num_tickets
-        )
-        self.bookings.append(new_booking)
+        # Create booking record (possibly recycled from the pool)
+        new_booking = self._new_booking(screening_id, screening.movie_title, num_tickets)
+        self._bookings[new_booking.booking_id] = new_booking
         return new_booking
 
+    def _new_booking(self, screening_id: str, movie_title: str, num_tickets: int) -> Booking:
+        """!
+        @brief Creates a `Booking`, recycling a pooled instance if any.
+        @details
+            Reused instances skip `__new__` and the dataclass `__init__`;
+            their fields are reassigned directly, always including a
+            fresh booking ID so recycled objects are indistinguishable
+            from new ones to callers.
+        @return Booking The ready-to-register booking.
+        """
+        pool = self._booking_pool
+        if pool:
+            booking = pool.pop()
+            booking.screening_id = screening_id
+            booking.movie_title = movie_title
+            booking.num_tickets = num_tickets
+            booking.booking_id = uuid4().hex
+            return booking
+        return Booking(screening_id=screening_id, movie_title=movie_title,
+                       num_tickets=num_tickets)
+
+    def book_tickets_bulk(self, requests: List[Tuple[str, int]]) -> List[Optional[Booking]]:
+        """!
+        @brief Books tickets for a whole batch of requests in one call.
+
+        @details
+            Batch counterpart of `book_tickets` for callers syncing a
+            queue of actions (e.g. a POS terminal). Validation per item
+            is identical, but the hot lookups are bound to locals once,
+            so the per-item cost is one dict probe, a range check and
+            one `Booking` allocation instead of full method dispatch.
+
+        @param requests A list of `(screening_id, num_tickets)` pairs.
+        @return List[Optional[Booking]]
+            One entry per request, in order: the created `Booking`, or
+            `None` where that request failed validation.
+        @see book_tickets()
+        """
+        screenings_get = self._screenings_by_id.get
+        screening_index = self._screening_index
+        seat_booked = self._seat_booked
+        bookings = self._bookings
+        results: List[Optional[Booking]] = []
+        append = results.append
+        for screening_id, num_tickets in requests:
+            # Same acceptance rule as book_tickets: plain ints on the
+            # fast path, other int-like types via __index__, bools out.
+            if type(num_tickets) is not int:
+                if isinstance(num_tickets, bool):
+                    append(None)
+                    continue
+                try:
+                    num_tickets = _as_index(num_tickets)
+                except TypeError:
+                    append(None)
+                    continue
+            screening = screenings_get(screening_id)
+            if screening is None or not (
+                    0 < num_tickets <= screening.total_seats - screening.booked_seats):
+                append(None)
+                continue
+            screening.booked_seats += num_tickets
+            seat_booked[screening_index[screening_id]] = screening.booked_seats
+            new_booking = self._new_booking(screening_id, screening.movie_title, num_tickets)
+            bookings[new_booking.booking_id] = new_booking
+            append(new_booking)
+        return results
+
+    def get_total_available_seats(self) -> int:
+        """!
+        @brief Total number of free seats across all screenings.
+        @details Sums the structure-of-arrays seat mirrors — two sums over
+            contiguous C ints — instead of iterating Screening objects.
+        @return int The number of available seats, summed over all screenings.
+        """
+        return sum(self._seat_total) - sum(self._seat_booked)
+
     def cancel_booking(self, booking_id: str) -> bool:
         """!
         @brief Cancels an existing booking by its ID.
@@ -324,7 +560,7 @@ class CinemaManager:
         
         @return bool `True` if cancellation was successful, `False` otherwise.
         """
-        booking_to_cancel = next((b for b in self.bookings if b.booking_id == booking_id), None)
+        booking_to_cancel = self._bookings.pop(booking_id, None)
         
         if not booking_to_cancel:
             return False
@@ -333,6 +569,9 @@ class CinemaManager:
         if screening:
             # Return seats, ensuring the count cannot go below zero
             screening.booked_seats = max(0, screening.booked_seats - booking_to_cancel.num_tickets)
+            self._seat_booked[self._screening_index[screening.screening_id]] = screening.booked_seats
         
-        self.bookings.remove(booking_to_cancel)
+        # Park the instance for reuse instead of letting it be GC'd.
+        booking_to_cancel.num_tickets = 0
+        self._booking_pool.append(booking_to_cancel)
         return True
\ No newline at end of file
@@ -366,5 +366,31 @@ class TestCinemaManagerBugs(unittest.TestCase):
         except Exception as e:
             self.fail(f"Error: An unexpected error {type(e).__name__} occurred instead of graceful handling.")
 
+    def test_22_bulk_booking_mixed_results(self):
+        """!
+        @test
+        @brief Verifies that `book_tickets_bulk` handles a mixed batch.
+        @details
+            Books a batch containing valid requests, an overbooking
+            attempt, an unknown screening ID, and a non-integer count.
+            Each invalid item should yield `None` in its position while
+            the valid items produce bookings and update the seat count.
+        """
+        self.manager.add_movie(Movie("Bulk Test Movie", 2020, "Test Director"))
+        screening = self.manager.add_screening("Bulk Test Movie", "2025-11-30 21:00", 10)
+        results = self.manager.book_tickets_bulk([
+            (screening.screening_id, 4),
+            (screening.screening_id, 100),   # more than available
+            ("non-existent-id", 1),          # unknown screening
+            (screening.screening_id, "two"), # non-integer count
+            (screening.screening_id, 3),
+        ])
+        self.assertIsInstance(results[0], Booking, "Error: A valid bulk request should produce a Booking.")
+        self.assertIsNone(results[1], "Error: Overbooking inside a batch should yield None.")
+        self.assertIsNone(results[2], "Error: An unknown screening ID inside a batch should yield None.")
+        self.assertIsNone(results[3], "Error: A non-integer ticket count inside a batch should yield None.")
+        self.assertIsInstance(results[4], Booking, "Error: A later valid request should still succeed.")
+        self.assertEqual(screening.available_seats, 3, "Error: Only the valid bulk requests should consume seats.")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file